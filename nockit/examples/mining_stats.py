@@ -13,34 +13,277 @@ Features:
 - Comprehensive error handling
 
 Usage:
-    python3 mining_stats.py [--socket PATH] [--timeout SECONDS] [--debug]
+    python3 mining_stats.py [--socket PATH] [--timeout SECONDS] [--top N] [--watch SECONDS]
+                            [--state-file PATH] [--debug]
 
 Requirements:
     - nockchain-wallet binary in PATH
     - Active nockchain socket connection
-    - Python 3.6+ with standard library
+    - Python 3.8+ with standard library
+    - Optional: google-re2 for linear-time coinbase matching
 """
 
+import hashlib
+import heapq
+import math
+import operator
+import os
+import pickle
 import re
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import argparse
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
+
+try:
+    import re2 as regex_engine  # google-re2: linear-time DFA matching, no backtracking
+except ImportError:
+    regex_engine = re  # Fallback to the standard library engine
 
 # ── DEFAULT CONFIGURATION ───────────────────────────────────────────────
 DEFAULT_SOCKET = Path.cwd() / ".socket" / "nockchain_npc.sock"
 DEFAULT_TIMEOUT = 30
 DEFAULT_DEBUG = False
+MAX_WATCH_INTERVAL = 7 * 24 * 3600  # longest accepted --watch interval (one week)
+READ_CHUNK_SIZE = 1 << 20  # bytes read from the wallet pipe per iteration
+STATE_VERSION = 1  # bump when the --state-file layout changes
+
+# ── COMPILED PATTERNS ───────────────────────────────────────────────────
+# Pattern matches: is-coinbase=%.y followed by pks=<|...signature...|>
+# The pattern is pure ASCII, so it runs directly on the raw bytes from the wallet pipe.
+# Hyperscan is deliberately not used: it cannot return the signature capture, and
+# leftmost-start reporting hides entries that begin inside an earlier candidate.
+# As a literal prefilter for the marker it was measured no faster than the regex
+# engine's own prefix search. Revisit once several patterns share this scan.
+_COINBASE_RE = regex_engine.compile(rb"is-coinbase=%\.y[\s\S]*?pks=<\|([\s\S]*?)\|>")
+_COINBASE_MARKER = b"is-coinbase=%.y"
+_PKS_OPEN = b"pks=<|"
+_COINBASE_TERMINATOR = b"|>"  # Every complete coinbase entry ends with this
+# ASCII whitespace deleted from signatures (what the wallet emits inside them)
+_DEL_WS = b" \t\n\r\v\f"
+
+class WalletClient:
+    """Runs nockchain-wallet commands against a single nockchain socket.
+    
+    Groups the wallet plumbing (command line, streaming, timeout, error
+    reporting) in one place. It is not a spawn-cost optimization: the wallet CLI
+    executes one command per process, so every call, including each ``--watch``
+    poll, is a full fork/exec of the binary.
+    """
+    
+    def __init__(self, socket_path: Path, timeout: int = DEFAULT_TIMEOUT):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._base_command: Optional[List[str]] = None
+    
+    def _command(self, *args: str) -> List[str]:
+        """Build a wallet command line, resolving the binary on first use."""
+        if self._base_command is None:
+            binary = shutil.which("nockchain-wallet")
+            if binary is None:
+                sys.exit("Error: nockchain-wallet binary not found in PATH")
+            self._base_command = [binary, "--nockchain-socket", str(self.socket_path)]
+        return [*self._base_command, *args]
+    
+    def list_notes(self) -> Iterator[bytes]:
+        """Yield the raw output of ``list-notes`` in chunks as the wallet writes it."""
+        timed_out = threading.Event()
+        
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(
+                self._command("list-notes"),
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=READ_CHUNK_SIZE,
+                start_new_session=True  # Own process group, so helpers it spawns die with it
+            )
+            
+            def kill_group() -> None:
+                # Killing only the child would leave grandchildren holding the pipe
+                # open, keeping the read below blocked until they exit on their own
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            
+            def kill_on_timeout() -> None:
+                timed_out.set()
+                kill_group()
+            
+            timer = threading.Timer(self.timeout, kill_on_timeout)
+            timer.start()
+            try:
+                while True:
+                    chunk = proc.stdout.read(READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    kill_group()
+                    proc.wait()
+                proc.stdout.close()
+            
+            if timed_out.is_set():
+                sys.exit(f"Error: list-notes command timed out after {self.timeout} seconds")
+            
+            if returncode != 0:
+                stderr_file.seek(0)
+                error_msg = stderr_file.read().decode(errors="replace").strip() or "Unknown error"
+                sys.exit(f"Error: list-notes failed with return code {returncode} ({error_msg})")
+
+def _extract_and_count(data: bytes, signature_counts: Counter) -> int:
+    """Count the complete coinbase entries in ``data`` into ``signature_counts``.
+    
+    Extraction, whitespace normalization and counting are fused into a single
+    pass over the regex matches. Signatures stay as raw ASCII bytes; they are
+    only decoded for display. Returns the offset from which scanning has to
+    resume once more data is available: the first unmatched coinbase marker, or
+    the last few bytes if none is present (a marker may straddle the boundary).
+    """
+    # Matches are consumed lazily by Counter.update (C counting loop); the last
+    # one is remembered to know where the complete entries end. Counting is
+    # ~10% of this pass even at a million entries, so a JIT kernel would not pay
+    # for packing the signatures into an array first.
+    # bytes() because re2 hands back bytearray slices for bytearray input
+    last_match = None
+    signature_counts.update(
+        bytes((last_match := match).group(1)).translate(None, _DEL_WS)
+        for match in _COINBASE_RE.finditer(data)
+    )
+    resume = last_match.end() if last_match is not None else 0
+    
+    pending = data.find(_COINBASE_MARKER, resume)
+    if pending != -1:
+        return pending
+    return max(resume, len(data) - len(_COINBASE_MARKER) + 1)
+
+class CoinbaseScanner:
+    """Counts coinbase signatures in wallet output fed to it chunk by chunk.
+    
+    Complete entries are counted and dropped as soon as they arrive. For an entry
+    that is still open, the ``pks=<|`` and closing ``|>`` it needs are searched
+    for only in newly fed bytes, and the regex runs again only once both are
+    present. The bytes between its marker and ``pks=<|`` can never be part of a
+    signature and are discarded, so a marker whose ``pks=<|`` never arrives
+    causes neither rescans nor retention of the rest of the output; only a
+    signature still waiting for its ``|>`` is kept.
+    
+    ``consumed`` counts the output bytes fully scanned so far, and
+    ``consumed_hash`` is a running hash of exactly those bytes (used by
+    ``--state-file`` to recognize the prefix on the next run).
+    """
+    
+    def __init__(self, signature_counts: Counter, consumed_hash: Optional["hashlib._Hash"] = None):
+        self.signature_counts = signature_counts
+        self.consumed_hash = consumed_hash if consumed_hash is not None else hashlib.blake2b()
+        self.consumed = 0
+        self._carry = bytearray()
+        self._pks_at = -1       # Offset of the open entry's pks=<| in the carry, once found
+        self._searched = 0      # Carry bytes already searched for the next token needed
+        self._dropped = 0       # Bytes cut from the open entry between marker and pks=<|
+        self._pending_hash: Optional["hashlib._Hash"] = None  # consumed_hash + marker + dropped
+    
+    def feed(self, chunk: bytes) -> None:
+        """Scan the next chunk of wallet output."""
+        self._carry += chunk
+        while self._advance():
+            consumed = _extract_and_count(self._carry, self.signature_counts)
+            if not consumed:
+                break
+            self._consume(consumed)
+    
+    def _advance(self) -> bool:
+        """Search the new bytes for the open entry's next token.
+        
+        Returns True once the carry holds at least one complete entry.
+        """
+        carry = self._carry
+        if self._pks_at < 0 and not carry.startswith(_COINBASE_MARKER):
+            # No entry open: look for the next marker, keeping a possible partial one
+            marker_at = carry.find(_COINBASE_MARKER, max(self._searched - len(_COINBASE_MARKER) + 1, 0))
+            if marker_at == -1:
+                self._consume(max(len(carry) - len(_COINBASE_MARKER) + 1, 0))
+                self._searched = len(carry)
+                return False
+            self._consume(marker_at)
+            self._searched = len(_COINBASE_MARKER)
+        
+        if self._pks_at < 0:
+            pks_at = carry.find(_PKS_OPEN, max(self._searched - len(_PKS_OPEN) + 1, len(_COINBASE_MARKER)))
+            if pks_at == -1:
+                self._drop_open_entry_body(max(len(carry) - len(_PKS_OPEN) + 1, len(_COINBASE_MARKER)))
+                self._searched = len(carry)
+                return False
+            self._pks_at = pks_at
+            self._searched = pks_at + len(_PKS_OPEN)
+        
+        terminator_at = carry.find(
+            _COINBASE_TERMINATOR,
+            max(self._searched - len(_COINBASE_TERMINATOR) + 1, self._pks_at + len(_PKS_OPEN))
+        )
+        if terminator_at == -1:
+            self._searched = len(carry)
+            return False
+        return True
+    
+    def _drop_open_entry_body(self, end: int) -> None:
+        """Discard carry bytes between the open entry's marker and ``end``.
+        
+        They are not consumed (a later run must rescan them from the marker), but
+        are folded into a side hash so ``consumed_hash`` stays exact once the entry
+        completes.
+        """
+        start = len(_COINBASE_MARKER)
+        if end <= start:
+            return
+        with memoryview(self._carry) as view:
+            if self._pending_hash is None:
+                self._pending_hash = self.consumed_hash.copy()
+                self._pending_hash.update(view[:start])
+            self._pending_hash.update(view[start:end])
+        del self._carry[start:end]
+        self._dropped += end - start
+    
+    def _consume(self, size: int) -> None:
+        """Mark the first ``size`` carry bytes as scanned and release them."""
+        if size <= 0:
+            return
+        with memoryview(self._carry) as view:
+            if self._pending_hash is not None:
+                # The open entry completed: continue from the hash of its dropped body
+                self._pending_hash.update(view[len(_COINBASE_MARKER):size])
+                self.consumed_hash = self._pending_hash
+            else:
+                self.consumed_hash.update(view[:size])
+        del self._carry[:size]
+        self.consumed += size + self._dropped
+        self._dropped = 0
+        self._pending_hash = None
+        self._pks_at = -1
+        self._searched = 0
 
 class MiningStatsAnalyzer:
     """Analyzes nockchain mining statistics from wallet data."""
     
-    def __init__(self, socket_path: Path, timeout: int = DEFAULT_TIMEOUT, debug: bool = DEFAULT_DEBUG):
+    def __init__(self, socket_path: Path, timeout: int = DEFAULT_TIMEOUT, debug: bool = DEFAULT_DEBUG,
+                 state_file: Optional[Path] = None):
         self.socket_path = socket_path
         self.timeout = timeout
         self.debug = debug
+        self.state_file = state_file
+        self.wallet = WalletClient(socket_path, timeout)
         
     def log(self, *args) -> None:
         """Debug logging output."""
@@ -55,70 +298,127 @@ class MiningStatsAnalyzer:
         if not self.socket_path.is_socket():
             sys.exit(f"Error: {self.socket_path} is not a valid socket")
     
-    def fetch_wallet_data(self) -> str:
-        """Fetch raw wallet data using nockchain-wallet list-notes command."""
+    def fetch_signature_counts(self) -> Counter:
+        """Stream wallet data from nockchain-wallet list-notes and count coinbase signatures.
+        
+        The output is scanned in chunks while the wallet is still writing it, so the
+        full dump is never held in memory. Only the still open entry at the end of
+        each chunk is carried over to the next one (see CoinbaseScanner).
+        
+        With a state file, the counts and the length and hash of the already scanned
+        prefix are persisted between runs; as long as the wallet output still starts
+        with that prefix, only the bytes after it are scanned.
+        """
         self.log("Running list-notes command...")
         
-        try:
-            proc = subprocess.run(
-                ["nockchain-wallet", "--nockchain-socket", str(self.socket_path), "list-notes"],
-                capture_output=True, 
-                text=True, 
-                timeout=self.timeout
-            )
-        except subprocess.TimeoutExpired:
-            sys.exit(f"Error: list-notes command timed out after {self.timeout} seconds")
-        except FileNotFoundError:
-            sys.exit("Error: nockchain-wallet binary not found in PATH")
+        offset, digest, signature_counts = self._load_state()
+        result = self._scan_wallet_output(offset, digest, signature_counts)
+        if result is None:
+            self.log("Wallet output changed since the last run, rescanning from the start")
+            result = self._scan_wallet_output(0, None, Counter())
         
-        if proc.returncode != 0:
-            error_msg = proc.stderr.strip() if proc.stderr else "Unknown error"
-            sys.exit(f"Error: list-notes failed with return code {proc.returncode} ({error_msg})")
+        signature_counts, offset, digest = result
+        if self.state_file is not None:
+            self._save_state(offset, digest, signature_counts)
         
-        raw_data = proc.stdout
-        self.log(f"Retrieved {len(raw_data)} bytes of wallet data")
-        return raw_data
+        self.log(f"Found {sum(signature_counts.values())} raw coinbase signature entries")
+        self.log(f"Processed signatures for {len(signature_counts)} unique wallets")
+        return signature_counts
     
-    def extract_coinbase_entries(self, raw_data: str) -> List[str]:
-        """Extract coinbase block entries from raw wallet data."""
-        # Pattern matches: is-coinbase=%.y followed by pks=<|...signature...|>
-        pattern = r"is-coinbase=%\.y[\s\S]*?pks=<\|([\s\S]*?)\|>"
-        matches = re.findall(pattern, raw_data)
+    def _scan_wallet_output(self, skip: int, expected_digest: Optional[bytes],
+                            signature_counts: Counter) -> Optional[Tuple[Counter, int, bytes]]:
+        """Count coinbase signatures in the list-notes output after its first ``skip`` bytes.
         
-        self.log(f"Found {len(matches)} raw coinbase signature entries")
-        return matches
-    
-    def process_coinbase_signatures(self, signatures: List[str]) -> Dict[str, int]:
-        """Process coinbase signatures and count occurrences per wallet."""
-        signature_counts = {}
+        The skipped prefix is only hashed and must match ``expected_digest``; if it
+        does not (or the output is shorter), None is returned. Otherwise returns the
+        updated counts with the offset and digest of everything scanned so far.
+        """
+        prefix_hash = hashlib.blake2b()
+        remaining = skip
+        total_bytes = 0
+        scanner = CoinbaseScanner(signature_counts, prefix_hash)
+        chunks = self.wallet.list_notes()
         
-        for signature in signatures:
-            # Normalize signature by removing whitespace and newlines
-            normalized_sig = re.sub(r"\s+", "", signature)
-            signature_counts[normalized_sig] = signature_counts.get(normalized_sig, 0) + 1
+        for chunk in chunks:
+            total_bytes += len(chunk)
+            if remaining:
+                head = chunk[:remaining]
+                prefix_hash.update(head)
+                remaining -= len(head)
+                if remaining == 0 and prefix_hash.digest() != expected_digest:
+                    chunks.close()
+                    return None
+                chunk = chunk[len(head):]
+            
+            scanner.feed(chunk)
         
-        self.log(f"Processed signatures for {len(signature_counts)} unique wallets")
-        return signature_counts
+        if remaining:
+            return None
+        
+        self.log(f"Retrieved {total_bytes} bytes of wallet data ({skip} already scanned)")
+        return signature_counts, skip + scanner.consumed, scanner.consumed_hash.digest()
+    
+    def _load_state(self) -> Tuple[int, Optional[bytes], Counter]:
+        """Load the persisted scan state, or an empty one if there is none."""
+        if self.state_file is not None:
+            try:
+                with open(self.state_file, 'rb') as f:
+                    state = pickle.load(f)
+                if state["version"] == STATE_VERSION:
+                    return state["offset"], state["digest"], Counter(state["counts"])
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.log(f"Ignoring unreadable state file {self.state_file}: {e}")
+        return 0, None, Counter()
     
-    def calculate_mined_blocks(self, signature_counts: Dict[str, int]) -> Dict[str, int]:
+    def _save_state(self, offset: int, digest: bytes, signature_counts: Counter) -> None:
+        """Atomically persist the scan state for the next incremental run."""
+        state = {
+            "version": STATE_VERSION,
+            "offset": offset,
+            "digest": digest,
+            "counts": dict(signature_counts),
+        }
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.state_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.log(f"Saved scan state ({offset} bytes) to {self.state_file}")
+    
+    def calculate_mined_blocks(self, signature_counts: Dict[bytes, int]) -> Tuple[Dict[bytes, int], int]:
         """Calculate complete mined blocks per wallet.
         
         Each complete block generates two signature entries, so we divide by 2
         and only count wallets with at least 2 signatures (complete blocks).
+        Returns the per-wallet block counts together with their total, which is
+        accumulated in the same pass so callers never need to re-sum.
         """
         blocks_mined = {}
+        total_blocks = 0
         
         for wallet, count in signature_counts.items():
             if count >= 2:  # Only count complete blocks
-                blocks_mined[wallet] = count // 2
+                blocks = count // 2
+                blocks_mined[wallet] = blocks
+                total_blocks += blocks
         
-        total_blocks = sum(blocks_mined.values())
         self.log(f"Calculated {total_blocks} total complete coinbase blocks")
         
-        return blocks_mined
+        return blocks_mined, total_blocks
     
-    def format_wallet_address(self, wallet: str, max_length: int = 36) -> str:
-        """Format wallet address for display with truncation."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_wallet_address(wallet: str, max_length: int = 36) -> str:
+        """Format wallet address for display with truncation.
+        
+        Pure and memoized, so re-rendering the rankings (``--watch``) is a cache hit.
+        """
         if len(wallet) <= max_length:
             return wallet
         
@@ -128,55 +428,91 @@ class MiningStatsAnalyzer:
         
         return f"{wallet[:prefix_len]}...{wallet[-suffix_len:]}"
     
-    def print_mining_rankings(self, blocks_mined: Dict[str, int]) -> None:
-        """Print formatted mining rankings table."""
+    def print_mining_rankings(self, blocks_mined: Dict[bytes, int], total_blocks: Optional[int] = None,
+                              top: Optional[int] = None) -> None:
+        """Print formatted mining rankings table.
+        
+        If ``top`` is given, only the ``top`` highest-ranked miners are listed;
+        the summary still covers all miners. The table is assembled in memory
+        and written with a single call, so piped output is not one write per row.
+        """
         if not blocks_mined:
             print("No complete coinbase blocks found.")
             return
         
-        total_blocks = sum(blocks_mined.values())
+        if total_blocks is None:
+            total_blocks = sum(blocks_mined.values())
+        inv_total = 100.0 / total_blocks
         
-        print(f"\nMiner Rankings (out of {total_blocks} full coinbase blocks):")
-        print(f"{'#':>4}  {'WALLET':36} {'BLOCKS':>6} {'%':>6}")
-        print("-" * 60)
+        lines: List[str] = [
+            f"\nMiner Rankings (out of {total_blocks} full coinbase blocks):",
+            f"{'#':>4}  {'WALLET':36} {'BLOCKS':>6} {'%':>6}",
+            "-" * 60,
+        ]
         
-        # Sort by blocks mined (descending) and enumerate for ranking
-        sorted_miners = sorted(blocks_mined.items(), key=lambda x: x[1], reverse=True)
+        # Sort by blocks mined (descending) and enumerate for ranking; a bounded
+        # heap selection avoids sorting every miner when only the top N are shown
+        if top is None:
+            sorted_miners = sorted(blocks_mined.items(), key=operator.itemgetter(1), reverse=True)
+        else:
+            sorted_miners = heapq.nlargest(top, blocks_mined.items(), key=operator.itemgetter(1))
         
         for rank, (wallet, block_count) in enumerate(sorted_miners, start=1):
-            formatted_wallet = self.format_wallet_address(wallet)
-            percentage = (block_count / total_blocks) * 100
+            formatted_wallet = self.format_wallet_address(wallet.decode("ascii"))
+            percentage = block_count * inv_total
             
-            print(f"{f'#{rank}':>4}  {formatted_wallet:36} {block_count:6d} {percentage:5.1f}%")
+            lines.append(f"{f'#{rank}':>4}  {formatted_wallet:36} {block_count:6d} {percentage:5.1f}%")
+        
+        lines.extend([
+            f"\nSummary:",
+            f"  Total miners: {len(blocks_mined)}",
+            f"  Total blocks: {total_blocks}",
+            f"  Average blocks per miner: {total_blocks / len(blocks_mined):.1f}",
+            f"  Last updated: {datetime.now():%Y-%m-%d %H:%M:%S}",
+        ])
         
-        print(f"\nSummary:")
-        print(f"  Total miners: {len(blocks_mined)}")
-        print(f"  Total blocks: {total_blocks}")
-        print(f"  Average blocks per miner: {total_blocks / len(blocks_mined):.1f}")
-        print(f"  Last updated: {datetime.now():%Y-%m-%d %H:%M:%S}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
-    def analyze_mining_stats(self) -> Dict[str, int]:
-        """Main analysis workflow."""
+    def analyze_mining_stats(self) -> Tuple[Dict[bytes, int], int]:
+        """Main analysis workflow.
+        
+        Returns the per-wallet block counts and the total number of complete blocks.
+        """
         # Step 1: Verify socket connection
         self.verify_socket()
         
-        # Step 2: Fetch wallet data
-        raw_data = self.fetch_wallet_data()
-        
-        # Step 3: Extract coinbase entries
-        coinbase_signatures = self.extract_coinbase_entries(raw_data)
+        # Step 2: Stream wallet data, counting coinbase signatures per wallet
+        signature_counts = self.fetch_signature_counts()
         
-        if not coinbase_signatures:
+        if not signature_counts:
             print("No coinbase blocks found in wallet data.")
-            return {}
+            return {}, 0
         
-        # Step 4: Process signatures and count per wallet
-        signature_counts = self.process_coinbase_signatures(coinbase_signatures)
-        
-        # Step 5: Calculate complete blocks mined
-        blocks_mined = self.calculate_mined_blocks(signature_counts)
-        
-        return blocks_mined
+        # Step 3: Calculate complete blocks mined
+        return self.calculate_mined_blocks(signature_counts)
+
+def positive_int(value: str) -> int:
+    """argparse type for integer options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+def watch_interval(value: str) -> float:
+    """argparse type for --watch: a finite number of seconds in (0, MAX_WATCH_INTERVAL]."""
+    try:
+        number = float(value)
+    except ValueError:
+        number = 0.0
+    if not (math.isfinite(number) and 0 < number <= MAX_WATCH_INTERVAL):
+        raise argparse.ArgumentTypeError(
+            f"must be a positive number of seconds up to {MAX_WATCH_INTERVAL}, got {value!r}"
+        )
+    return number
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -188,6 +524,9 @@ Examples:
   python3 mining_stats.py
   python3 mining_stats.py --socket /custom/path/to/socket
   python3 mining_stats.py --timeout 60 --debug
+  python3 mining_stats.py --top 10
+  python3 mining_stats.py --watch 30 --top 10
+  python3 mining_stats.py --watch 30 --state-file ~/.cache/nockchain/mining_stats.state
   python3 mining_stats.py --help
         """
     )
@@ -206,6 +545,27 @@ Examples:
         help=f"Timeout for wallet commands in seconds (default: {DEFAULT_TIMEOUT})"
     )
     
+    parser.add_argument(
+        "--top",
+        type=positive_int,
+        metavar="N",
+        help="Only show the N highest-ranked miners (default: show all)"
+    )
+    
+    parser.add_argument(
+        "--watch",
+        type=watch_interval,
+        metavar="SECONDS",
+        help="Re-run the analysis every SECONDS seconds until interrupted"
+    )
+    
+    parser.add_argument(
+        "--state-file",
+        type=Path,
+        metavar="PATH",
+        help="Persist counts between runs and only scan wallet output added since the last run"
+    )
+    
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -232,17 +592,27 @@ def main() -> None:
     analyzer = MiningStatsAnalyzer(
         socket_path=args.socket,
         timeout=args.timeout,
-        debug=args.debug
+        debug=args.debug,
+        state_file=args.state_file
     )
     
     try:
-        # Run analysis
-        blocks_mined = analyzer.analyze_mining_stats()
-        
-        # Display results
-        analyzer.print_mining_rankings(blocks_mined)
+        while True:
+            # Run analysis
+            blocks_mined, total_blocks = analyzer.analyze_mining_stats()
+            
+            # Display results
+            analyzer.print_mining_rankings(blocks_mined, total_blocks, top=args.top)
+            
+            if args.watch is None:
+                break
+            time.sleep(args.watch)
         
     except KeyboardInterrupt:
+        if args.watch is not None:
+            # Interrupting is the documented way to leave watch mode
+            print("\n\nStopped watching.")
+            sys.exit(0)
         print("\n\nAnalysis interrupted by user.")
         sys.exit(1)
     except Exception as e:
@@ -22,8 +22,15 @@ Examples:
 """
 
 import argparse
+import datetime
+import hashlib
 import json
+import os
+import pickle
+import re
 import sys
+import tempfile
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -36,23 +43,114 @@ except ImportError:
         print("Error: tomllib/tomli not available. Install with: pip install tomli")
         sys.exit(1)
 
+try:
+    import orjson  # Optional, much faster JSON encoder
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_default(obj: Any) -> str:
+        # TOML dates/times, serialized as ISO 8601 the way orjson does
+        if isinstance(obj, (datetime.date, datetime.time)):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _json_dumps(obj: Any) -> str:
+        # Same output as the orjson branch: raw UTF-8 rather than \uXXXX escapes
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+
+def _cache_dir() -> Optional[Path]:
+    """Directory for cached parsed configs, or None if there is nowhere to put it.
+    
+    Follows the XDG spec: $XDG_CACHE_HOME if set to an absolute path (empty or
+    relative values are ignored), otherwise ~/.cache.
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache and os.path.isabs(xdg_cache):
+        return Path(xdg_cache) / "nockchain"
+    try:
+        return Path.home() / ".cache" / "nockchain"
+    except (RuntimeError, KeyError):
+        return None  # No resolvable home directory
+
+# Accepted multiaddr prefixes for peer addresses, checked in one match
+_ADDR_RE = re.compile(r"/(?:ip4|ip6|dns[46]?)/")
+
 class PeerConfigHelper:
     """Helper class for managing nockchain peer configurations."""
     
     def __init__(self, config_path: Path):
         self.config_path = config_path
         self.config = self._load_config()
+        self._build_indexes()
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load and parse the TOML configuration file."""
+        """Load and parse the TOML configuration file.
+        
+        The parsed result is pickled to the cache directory and reused for as long as the
+        file's modification time is unchanged, skipping the TOML parse on repeat runs.
+        """
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
+        key = hashlib.blake2b(str(self.config_path.resolve()).encode()).hexdigest()[:16]
+        cache_dir = _cache_dir()
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = cache_dir / f"peers-{key}-{self.config_path.stat().st_mtime_ns}.pkl"
+            try:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+            except Exception:
+                pass  # Missing or unreadable cache entry; fall back to parsing
+        
         try:
             with open(self.config_path, 'rb') as f:
-                return tomllib.load(f)
+                config = tomllib.load(f)
         except Exception as e:
             raise ValueError(f"Failed to parse configuration file: {e}")
+        
+        if cache_path is not None:
+            self._write_cache(cache_path, key, config)
+        return config
+    
+    def _write_cache(self, cache_path: Path, key: str, config: Dict[str, Any]) -> None:
+        """Atomically store a parsed config, dropping stale entries for the same file."""
+        cache_dir = cache_path.parent
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in cache_dir.glob(f"peers-{key}-*.pkl"):
+                stale.unlink()
+            
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass  # Caching is best-effort; a read-only home must not break the helper
+    
+    def _build_indexes(self) -> None:
+        """Index peer positions by normalized region, reliability and provider.
+        
+        The config does not change after loading, so filters become dictionary
+        lookups instead of scans over every peer. Values are normalized via str()
+        so a mistyped field cannot break loading, and entries that are not tables
+        are left out (validate_config reports them).
+        """
+        self._by_region: Dict[str, List[int]] = defaultdict(list)
+        self._by_reliability: Dict[str, List[int]] = defaultdict(list)
+        self._by_provider: Dict[str, List[int]] = defaultdict(list)
+        
+        for i, peer in enumerate(self.get_all_peers()):
+            if not isinstance(peer, dict):
+                continue
+            self._by_region[str(peer.get('region', '')).upper()].append(i)
+            self._by_reliability[str(peer.get('reliability', '')).lower()].append(i)
+            self._by_provider[str(peer.get('provider', '')).upper()].append(i)
     
     def get_all_peers(self) -> List[Dict[str, Any]]:
         """Get all peer configurations."""
@@ -62,19 +160,25 @@ class PeerConfigHelper:
                     region: Optional[str] = None,
                     reliability: Optional[str] = None,
                     provider: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Filter peers based on specified criteria."""
+        """Filter peers based on specified criteria using the load-time indexes."""
         peers = self.get_all_peers()
         
+        # Positions matching each active filter; an empty/None filter matches everything
+        matches: List[List[int]] = []
         if region:
-            peers = [p for p in peers if p.get('region', '').upper() == region.upper()]
-        
+            matches.append(self._by_region.get(region.upper(), []))
         if reliability:
-            peers = [p for p in peers if p.get('reliability', '').lower() == reliability.lower()]
-        
+            matches.append(self._by_reliability.get(reliability.lower(), []))
         if provider:
-            peers = [p for p in peers if p.get('provider', '').upper() == provider.upper()]
+            matches.append(self._by_provider.get(provider.upper(), []))
+        
+        if not matches:
+            return list(peers)
         
-        return peers
+        # Intersect starting from the most selective filter, keeping config order
+        matches.sort(key=len)
+        selected = set(matches[0]).intersection(*matches[1:])
+        return [peers[i] for i in sorted(selected)]
     
     def get_regional_peers(self, region: str) -> List[str]:
         """Get peer addresses for a specific region from the regions configuration."""
@@ -99,27 +203,29 @@ class PeerConfigHelper:
     
     def format_as_json(self, peers: List[Dict[str, Any]]) -> str:
         """Format peer list as JSON."""
-        return json.dumps(peers, indent=2)
+        return _json_dumps(peers)
     
     def format_as_table(self, peers: List[Dict[str, Any]]) -> str:
         """Format peer list as a readable table."""
         if not peers:
             return "No peers found matching criteria."
         
-        lines: List[str] = []
-        header = f"{'ADDRESS':50} {'REGION':8} {'RELIABILITY':12} {'PROVIDER':10}"
-        separator = "-" * 85
-        lines.append(header)
-        lines.append(separator)
+        # One template for header and rows: a single format call per line
+        format_row = "{:50} {:8} {:12} {:10}".format
         
-        for peer in peers:
-            address = peer['address']
-            region = peer.get('region', 'Unknown')
-            reliability = peer.get('reliability', 'Unknown')
-            provider = peer.get('provider', 'N/A')
-            
-            row = f"{address:50} {region:8} {reliability:12} {provider:10}"
-            lines.append(row)
+        lines: List[str] = [
+            format_row('ADDRESS', 'REGION', 'RELIABILITY', 'PROVIDER'),
+            "-" * 85,
+        ]
+        lines.extend(
+            format_row(
+                peer['address'],
+                peer.get('region', 'Unknown'),
+                peer.get('reliability', 'Unknown'),
+                peer.get('provider', 'N/A'),
+            )
+            for peer in peers
+        )
         
         return "\n".join(lines)
     
@@ -145,12 +251,16 @@ class PeerConfigHelper:
         # Validate peer entries
         peers = self.get_all_peers()
         for i, peer in enumerate(peers):
+            if not isinstance(peer, dict):
+                issues.append(f"Peer {i}: entry is not a table")
+                continue
+            
             if 'address' not in peer:
                 issues.append(f"Peer {i}: missing 'address' field")
             
             # Basic address format validation
             address = peer.get('address', '')
-            if not address.startswith('/ip4/'):
+            if not isinstance(address, str) or not _ADDR_RE.match(address):
                 issues.append(f"Peer {i}: invalid address format: {address}")
         
         return issues
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the streaming coinbase scan in mining_stats.py.
+
+Run with: python3 -m unittest nockit/examples/test_mining_stats.py
+"""
+
+import hashlib
+import re
+import sys
+import unittest
+from collections import Counter
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import mining_stats  # noqa: E402
+
+# The original, non-streaming extraction the scanner must agree with
+_REFERENCE_RE = re.compile(rb"is-coinbase=%\.y[\s\S]*?pks=<\|([\s\S]*?)\|>")
+
+def reference_counts(data: bytes) -> Counter:
+    return Counter(re.sub(rb"\s+", b"", sig) for sig in _REFERENCE_RE.findall(data))
+
+def stream(data: bytes, chunk_size: int) -> mining_stats.CoinbaseScanner:
+    scanner = mining_stats.CoinbaseScanner(Counter())
+    for i in range(0, len(data), chunk_size):
+        scanner.feed(data[i:i + chunk_size])
+    return scanner
+
+COMPLETE = b"".join(
+    b"note %d\n  is-coinbase=%%.y\n  pks=<|w%d\n   ab|>\n" % (i, i % 7) for i in range(50)
+)
+
+class CoinbaseScannerTest(unittest.TestCase):
+    def assert_matches_reference(self, data: bytes, chunk_sizes=(1, 2, 5, 16, 4096)) -> None:
+        for chunk_size in chunk_sizes:
+            with self.subTest(chunk_size=chunk_size):
+                scanner = stream(data, chunk_size)
+                self.assertEqual(scanner.signature_counts, reference_counts(data))
+                self.assertEqual(
+                    scanner.consumed_hash.digest(),
+                    hashlib.blake2b(data[:scanner.consumed]).digest()
+                )
+    
+    def test_complete_entries(self):
+        self.assert_matches_reference(COMPLETE)
+    
+    def test_entry_spanning_notes(self):
+        # A coinbase flag without its own pks pairs with the next pks field
+        self.assert_matches_reference(
+            b"is-coinbase=%.y x=<|a|> is-coinbase=%.y y pks=<|w1|> pks=<|w2|> is-coinbase=%.y pks=<|w3"
+        )
+    
+    def test_open_entry_with_other_sets_is_not_rescanned(self):
+        # One marker never followed by pks=<|, while `<|...|>` keeps appearing
+        data = COMPLETE + b"is-coinbase=%.y\n" + b"  lock=[m=1 keys=<|a|>]\n" * 20000
+        self.assert_matches_reference(data, chunk_sizes=(7, 1024))
+        
+        calls = []
+        real_extract = mining_stats._extract_and_count
+        def counting_extract(*args):
+            calls.append(1)
+            return real_extract(*args)
+        
+        scanner = mining_stats.CoinbaseScanner(Counter())
+        with mock.patch.object(mining_stats, "_extract_and_count", counting_extract):
+            for i in range(0, len(data), 1024):
+                scanner.feed(data[i:i + 1024])
+                self.assertLess(len(scanner._carry), 2048)
+        # The regex only runs for chunks that complete an entry, never for the tail
+        self.assertLessEqual(len(calls), len(COMPLETE) // 1024 + 2)
+
+if __name__ == "__main__":
+    unittest.main()